@@ -1,17 +1,33 @@
 #!/usr/bin/python3
 
 import os.path
+import re
 import sys
 
 fname = sys.argv[1]
 
-text = open(fname, encoding="windows-1252").read()
+for logtype in ("event_targets.log", "triggers.log", "effects.log", "modifiers.log"):
+    if fname.endswith(logtype):
+        break
+else:
+    sys.exit("%s: don't know how to sort %s" % (sys.argv[0], fname))
+
+with open(fname, encoding="windows-1252") as f:
+    text = f.read()
 
 SEPARATOR = "\n--------------------\n\n"
 
-items = text.split(SEPARATOR)
+# Lines dropped from three-line items in modifiers.log before sorting:
+# a "Printing " first line, or otherwise an "Extra " second line.
+# Substitute with group 1 to keep the first line in the "Extra " case.
+MODIFIER_SKIP_RE = re.compile(
+    r"(?:\A|(?<=\n\n))"
+    r"(?:Printing [^\n]*\n(?=[^\n]+\n[^\n]+(?:\n\n|\n?\Z))"
+    r"|([^\n]+\n)Extra [^\n]*\n(?=[^\n]+(?:\n\n|\n?\Z)))")
 
-if fname.endswith("event_targets.log"):
+if logtype == "event_targets.log":
+    items = text.split(SEPARATOR)
+    del text
     header = items[0]
     footer = items[-1]
     del items[0]
@@ -21,7 +37,9 @@ if fname.endswith("event_targets.log"):
     items.append(footer)
     print(SEPARATOR.join(items))
 
-elif fname.endswith("triggers.log"):
+elif logtype == "triggers.log":
+    items = text.split(SEPARATOR)
+    del text
     header = items[0:2]
     del items[0:1]
 
@@ -32,7 +50,9 @@ elif fname.endswith("triggers.log"):
 
     print(SEPARATOR.join(items))
 
-elif fname.endswith("effects.log"):
+elif logtype == "effects.log":
+    items = text.split(SEPARATOR)
+    del text
     header = items[0]
     del items[0]
 
@@ -41,22 +61,16 @@ elif fname.endswith("effects.log"):
     items.insert(0, header)
     print(SEPARATOR.join(items))
 
-elif fname.endswith("modifiers.log"):
-    items = text.split("\n\n")
+elif logtype == "modifiers.log":
+    items = MODIFIER_SKIP_RE.sub(r"\1", text).split("\n\n")
     sortable = []
     for item in items:
         lines = item.splitlines()
-        if len(lines) == 3:
-            if lines[0].startswith("Printing "):
-                del lines[0]
-            elif lines[1].startswith("Extra "):
-                del lines[1]
         if not lines:
             continue
-        lines = [ lines[1], lines[0] ]
-        sortable.append(lines)
+        if len(lines) < 2:
+            sys.exit("%s: modifier entry has only one line: %r" % (sys.argv[0], item))
+        # sort on the second line, then the first; any later lines are dropped
+        sortable.append((lines[1], lines[0]))
     sortable.sort()
-    for lines in sortable:
-        print(lines[1])
-        print(lines[0])
-        print()
+    sys.stdout.write("".join("%s\n%s\n\n" % (first, second) for second, first in sortable))